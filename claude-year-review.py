@@ -18,17 +18,30 @@ Usage:
   python3 claude-year-review.py --json                    # Output as JSON
 """
 
+from __future__ import annotations
+
 import json
 import os
-import shutil
 import subprocess
 import sys
-import tempfile
-import webbrowser
-from collections import defaultdict
-from datetime import datetime, timedelta
+from collections import Counter, defaultdict
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from tool_parsers import (
+    analyze_codex_dir,
+    analyze_opencode_dir,
+    map_session_files,
+    parse_jsonl,
+    parse_timestamp,
+    shutdown_pool,
+)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 # Tool configuration with brand colors
@@ -50,6 +63,19 @@ def run_cmd(cmd: List[str], timeout: int = 60) -> Tuple[bool, str]:
         return False, str(e)
 
 
+def _rsync_dir(source: str, local_dir: Path) -> bool:
+    """Copy a remote directory into local_dir with rsync."""
+    sync_args = ["--timeout=30", source, str(local_dir) + "/"]
+    # zstd compresses better than the default zlib at a fraction of the CPU,
+    # but rsync < 3.2 rejects --compress-choice and either side may lack zstd,
+    # so any failure other than a timeout is retried with plain -avz
+    compress_args = ["-a", "--compress-choice=zstd", "--compress-level=3"]
+    success, output = run_cmd(["rsync"] + compress_args + sync_args, timeout=60)
+    if not success and "timed out" not in output and "io timeout" not in output:
+        success, output = run_cmd(["rsync", "-avz"] + sync_args, timeout=60)
+    return success
+
+
 def fetch_remote_data(remote: str, temp_dir: Path) -> Dict[str, Path]:
     """Fetch all AI tool data from a remote host. Returns dict of tool_name -> local_path."""
     base_dir = temp_dir / remote.replace("@", "_at_").replace(".", "_").replace(
@@ -67,21 +93,18 @@ def fetch_remote_data(remote: str, temp_dir: Path) -> Dict[str, Path]:
     fetched = {}
     print(f"  Fetching data from {remote}...")
 
-    for tool_name, remote_path in tools_to_fetch:
-        local_dir = base_dir / tool_name
+    local_dirs = [base_dir / tool_name for tool_name, _ in tools_to_fetch]
+    for local_dir in local_dirs:
         local_dir.mkdir(parents=True, exist_ok=True)
 
-        success, output = run_cmd(
-            [
-                "rsync",
-                "-avz",
-                "--timeout=30",
-                f"{remote}:{remote_path}",
-                str(local_dir) + "/",
-            ],
-            timeout=60,
-        )
+    # Each tool is a separate rsync round trip, so run them side by side
+    from concurrent.futures import ThreadPoolExecutor
 
+    with ThreadPoolExecutor(max_workers=len(tools_to_fetch)) as executor:
+        sources = [f"{remote}:{remote_path}" for _, remote_path in tools_to_fetch]
+        results = list(executor.map(_rsync_dir, sources, local_dirs))
+
+    for (tool_name, _), local_dir, success in zip(tools_to_fetch, local_dirs, results):
         if success and any(local_dir.iterdir()):
             print(f"    Found {tool_name} on {remote}")
             fetched[tool_name] = local_dir
@@ -122,9 +145,7 @@ def analyze_continue_dir(continue_dir: Path, source_name: str = "local") -> Dict
         for entry in parse_jsonl(tokens_file):
             ts = parse_timestamp(entry.get("timestamp"))
             if ts:
-                data["timestamps"].append(
-                    {"ts": ts, "source": source_name, "tool": "continue"}
-                )
+                data["timestamps"].append(ts)
 
             model = entry.get("model", "unknown")
             prompt_tokens = entry.get("promptTokens", 0)
@@ -184,53 +205,6 @@ def find_all_tool_dirs(include_local: bool = True) -> List[Tuple[str, Path, str]
     return dirs
 
 
-def parse_jsonl(filepath: Path) -> List[Dict]:
-    entries = []
-    if not filepath.exists():
-        return entries
-
-    try:
-        with open(filepath, "r", encoding="utf-8", errors="ignore") as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    try:
-                        entries.append(json.loads(line))
-                    except json.JSONDecodeError:
-                        continue
-    except Exception:
-        pass
-
-    return entries
-
-
-def parse_timestamp(ts: Any) -> Optional[datetime]:
-    if ts is None:
-        return None
-
-    try:
-        if isinstance(ts, (int, float)):
-            if ts > 1e12:
-                return datetime.fromtimestamp(ts / 1000)
-            return datetime.fromtimestamp(ts)
-
-        if isinstance(ts, str):
-            for fmt in [
-                "%Y-%m-%dT%H:%M:%S.%fZ",
-                "%Y-%m-%dT%H:%M:%SZ",
-                "%Y-%m-%dT%H:%M:%S.%f",
-                "%Y-%m-%dT%H:%M:%S",
-            ]:
-                try:
-                    return datetime.strptime(ts, fmt)
-                except ValueError:
-                    continue
-    except Exception:
-        pass
-
-    return None
-
-
 MACHINE_COLORS = [
     "#ff6b35",
     "#4ecdc4",
@@ -243,6 +217,78 @@ MACHINE_COLORS = [
 ]
 
 
+# Session parsing keeps per-model usage as a flat row of ints in this order
+# and only expands it into the {"input": ..., ...} dict schema at the end
+USAGE_FIELDS = ("input", "output", "cache_read", "cache_creation", "total")
+
+
+def _parse_session_file(session_file: str) -> Dict:
+    """Summarize a project session file: per-model tokens, messages, duration."""
+    model_usage = {}
+    messages = 0
+    first_ts = None
+    last_ts = None
+    for entry in parse_jsonl(session_file):
+        raw_ts = entry.get("timestamp")
+        if raw_ts is not None:
+            if first_ts is None:
+                first_ts = raw_ts
+            last_ts = raw_ts
+
+        msg = entry.get("message")
+        if not msg:
+            continue
+        msg_get = msg.get
+        if msg_get("role") in ("user", "assistant"):
+            messages += 1
+
+        usage = msg_get("usage")
+        if not usage:
+            continue
+
+        usage_get = usage.get
+        input_t = usage_get("input_tokens", 0)
+        output_t = usage_get("output_tokens", 0)
+        cache_read = usage_get("cache_read_input_tokens", 0)
+        cache_create = usage_get("cache_creation_input_tokens", 0)
+
+        model = msg_get("model", "unknown")
+        row = model_usage.get(model)
+        if row is None:
+            row = model_usage[model] = [0, 0, 0, 0, 0]
+
+        row[0] += input_t
+        row[1] += output_t
+        row[2] += cache_read
+        row[3] += cache_create
+        row[4] += input_t + output_t + cache_read + cache_create
+
+    # Entries are appended in order, so only the ends need parsing
+    duration_ms = 0
+    start = parse_timestamp(first_ts)
+    end = parse_timestamp(last_ts)
+    if start and end:
+        duration_ms = int((end - start).total_seconds() * 1000)
+
+    return {
+        "model_usage": model_usage,
+        "messages": messages,
+        "duration_ms": duration_ms,
+    }
+
+
+def _iter_activity_files(claude_dir: Path) -> Iterator[str]:
+    """Yield the JSONL files whose entries count as activity events."""
+    yield os.path.join(claude_dir, "history.jsonl")
+    try:
+        with os.scandir(os.path.join(claude_dir, "transcripts")) as it:
+            for e in it:
+                if e.name.endswith(".jsonl"):
+                    yield e.path
+    except OSError:
+        pass
+
+
 def analyze_claude_dir(claude_dir: Path, source_name: str = "local") -> Dict:
     data = {
         "source": source_name,
@@ -255,102 +301,96 @@ def analyze_claude_dir(claude_dir: Path, source_name: str = "local") -> Dict:
         "longest_session": None,
     }
 
-    history_file = claude_dir / "history.jsonl"
-    for entry in parse_jsonl(history_file):
-        ts = parse_timestamp(entry.get("timestamp"))
-        if ts:
-            data["timestamps"].append(
-                {"ts": ts, "source": source_name, "tool": "claude-code"}
-            )
-
-    stats_file = claude_dir / "stats-cache.json"
-    if stats_file.exists():
-        try:
-            with open(stats_file, "r") as f:
-                stats = json.load(f)
-
-            data["total_sessions"] = stats.get("totalSessions", 0)
-            data["total_messages"] = stats.get("totalMessages", 0)
-
-            longest = stats.get("longestSession", {})
-            if longest:
-                data["longest_session"] = {
-                    "duration_ms": longest.get("duration", 0),
-                    "messages": longest.get("messageCount", 0),
-                }
-        except Exception:
-            pass
-
-    transcripts_dir = claude_dir / "transcripts"
-    if transcripts_dir.exists():
-        for transcript_file in transcripts_dir.glob("*.jsonl"):
-            for entry in parse_jsonl(transcript_file):
-                ts = parse_timestamp(entry.get("timestamp"))
-                if ts:
-                    data["timestamps"].append(
-                        {"ts": ts, "source": source_name, "tool": "claude-code"}
-                    )
+    timestamps = data["timestamps"]
+    for activity_file in _iter_activity_files(claude_dir):
+        for entry in parse_jsonl(activity_file):
+            ts = parse_timestamp(entry.get("timestamp"))
+            if ts:
+                timestamps.append(ts)
 
     projects_dir = claude_dir / "projects"
     if projects_dir.exists():
+        session_files = []
         for project_dir in projects_dir.iterdir():
             if project_dir.is_dir():
                 project_name = project_dir.name.replace("-", "/").lstrip("/")
-                session_files = list(project_dir.glob("*.jsonl"))
+                # An unreadable project still counts, just with no sessions
+                try:
+                    with os.scandir(project_dir) as it:
+                        project_files = [
+                            e.path for e in it if e.name.endswith(".jsonl")
+                        ]
+                except OSError:
+                    project_files = []
                 data["projects"].append(
                     {
                         "name": project_name,
-                        "sessions": len(
-                            [
-                                f
-                                for f in session_files
-                                if not f.name.startswith("agent-")
-                            ]
+                        "sessions": sum(
+                            1
+                            for p in project_files
+                            if not os.path.basename(p).startswith("agent-")
                         ),
                     }
                 )
+                session_files.extend(project_files)
+
+        # Session files are the source of truth for tokens, sessions and
+        # messages (stats-cache.json is undocumented and may be stale/incomplete)
+        results = map_session_files(_parse_session_file, session_files)
+
+        model_rows = {}
+        longest = None
+        for session_file, session in zip(session_files, results):
+            if not os.path.basename(session_file).startswith("agent-"):
+                data["total_sessions"] += 1
+                data["total_messages"] += session["messages"]
+                if longest is None or session["duration_ms"] > longest["duration_ms"]:
+                    longest = session
+
+            for model, row in session["model_usage"].items():
+                totals = model_rows.get(model)
+                if totals is None:
+                    model_rows[model] = row
+                else:
+                    model_rows[model] = [a + b for a, b in zip(totals, row)]
+
+        for model, row in model_rows.items():
+            data["model_usage"][model] = dict(zip(USAGE_FIELDS, row))
 
-                # Always parse session files for accurate token counts
-                # (stats-cache.json is undocumented and may be stale/incomplete)
-                for session_file in session_files:
-                    for entry in parse_jsonl(session_file):
-                        msg = entry.get("message", {})
-                        usage = msg.get("usage", {})
-                        model = msg.get("model", "unknown")
-
-                        if usage:
-                            input_t = usage.get("input_tokens", 0)
-                            output_t = usage.get("output_tokens", 0)
-                            cache_read = usage.get("cache_read_input_tokens", 0)
-                            cache_create = usage.get("cache_creation_input_tokens", 0)
-
-                            if model not in data["model_usage"]:
-                                data["model_usage"][model] = {
-                                    "input": 0,
-                                    "output": 0,
-                                    "cache_read": 0,
-                                    "cache_creation": 0,
-                                    "total": 0,
-                                }
-
-                            data["model_usage"][model]["input"] += input_t
-                            data["model_usage"][model]["output"] += output_t
-                            data["model_usage"][model]["cache_read"] += cache_read
-                            data["model_usage"][model]["cache_creation"] += cache_create
-                            data["model_usage"][model]["total"] += (
-                                input_t + output_t + cache_read + cache_create
-                            )
+        if longest is not None:
+            data["longest_session"] = {
+                "duration_ms": longest["duration_ms"],
+                "messages": longest["messages"],
+            }
 
     return data
 
 
+def _analyze_source(job: Tuple[str, Path, str]) -> Optional[Dict]:
+    """Run the analyzer for one (tool name, directory, source name) job."""
+    tool_name, tool_dir, source_name = job
+    if tool_name == "claude-code":
+        return analyze_claude_dir(tool_dir, source_name=source_name)
+    if tool_name == "continue":
+        return analyze_continue_dir(tool_dir, source_name=source_name)
+    if tool_name == "codex":
+        return analyze_codex_dir(tool_dir, source_name=source_name)
+    if tool_name == "opencode":
+        return analyze_opencode_dir(tool_dir, source_name=source_name)
+    return None
+
+
 def aggregate_data(
-    sources: List[Dict], merge_mapping: Optional[Dict[str, str]] = None
+    sources: List[Dict],
+    now: datetime,
+    merge_mapping: Optional[Dict[str, str]] = None,
 ) -> Dict:
     if merge_mapping is None:
         merge_mapping = {}
 
-    all_timestamps = []
+    day_events = Counter()  # day ordinal -> events across all sources
+    tool_days = defaultdict(set)  # tool name -> active day ordinals
+    source_ranges = []
     total_sessions = 0
     total_messages = 0
     model_usage = {}
@@ -361,6 +401,7 @@ def aggregate_data(
     source_colors = {}
     per_source_stats = {}
     tools_seen = set()
+    tool_names = []
     tool_colors = {}
     per_tool_stats = {}
 
@@ -371,6 +412,7 @@ def aggregate_data(
 
         if tool_name not in tools_seen:
             tools_seen.add(tool_name)
+            tool_names.append(tool_name)
             tool_cfg = TOOL_CONFIG.get(
                 tool_name,
                 {"color": MACHINE_COLORS[len(tools_seen) % len(MACHINE_COLORS)]},
@@ -381,15 +423,24 @@ def aggregate_data(
             source_names_seen.add(source_name)
             source_names.append(source_name)
             source_colors[source_name] = MACHINE_COLORS[
-                len(source_names) - 1 % len(MACHINE_COLORS)
+                (len(source_names) - 1) % len(MACHINE_COLORS)
             ]
 
-        timestamps_with_renamed_source = []
-        for ts_entry in source.get("timestamps", []):
-            new_entry = ts_entry.copy()
-            new_entry["source"] = source_name
-            timestamps_with_renamed_source.append(new_entry)
-        all_timestamps.extend(timestamps_with_renamed_source)
+        source_ts = source.get("timestamps", [])
+        # Sources that truncate timestamps report their real range separately
+        source_range = source.get("date_range")
+        if source_range:
+            source_ranges.append(source_range)
+        elif source_ts:
+            source_ranges.append((min(source_ts), max(source_ts)))
+        # Events only matter per day; parsers that already combine them
+        # (Codex) hand over {day ordinal: events}, the rest are counted here
+        source_days = source.get("day_counts") or Counter(
+            map(datetime.toordinal, source_ts)
+        )
+        source_events = sum(source_days.values())
+        day_events.update(source_days)
+        tool_days[tool_name].update(source_days)
 
         total_sessions += source.get("total_sessions", 0)
         total_messages += source.get("total_messages", 0)
@@ -397,7 +448,6 @@ def aggregate_data(
         source_tokens = sum(
             m.get("total", 0) for m in source.get("model_usage", {}).values()
         )
-        source_ts = [t["ts"] for t in source.get("timestamps", [])]
 
         if source_name not in per_source_stats:
             per_source_stats[source_name] = {
@@ -411,8 +461,8 @@ def aggregate_data(
         per_source_stats[source_name]["tokens"] += source_tokens
         per_source_stats[source_name]["sessions"] += source.get("total_sessions", 0)
         per_source_stats[source_name]["messages"] += source.get("total_messages", 0)
-        per_source_stats[source_name]["events"] += len(source.get("timestamps", []))
-        per_source_stats[source_name]["days_set"].update(t.date() for t in source_ts)
+        per_source_stats[source_name]["events"] += source_events
+        per_source_stats[source_name]["days_set"].update(source_days)
 
         if tool_name not in per_tool_stats:
             per_tool_stats[tool_name] = {
@@ -425,8 +475,8 @@ def aggregate_data(
         per_tool_stats[tool_name]["tokens"] += source_tokens
         per_tool_stats[tool_name]["sessions"] += source.get("total_sessions", 0)
         per_tool_stats[tool_name]["messages"] += source.get("total_messages", 0)
-        per_tool_stats[tool_name]["events"] += len(source.get("timestamps", []))
-        per_tool_stats[tool_name]["days_set"].update(t.date() for t in source_ts)
+        per_tool_stats[tool_name]["events"] += source_events
+        per_tool_stats[tool_name]["days_set"].update(source_days)
 
         for model, usage in source.get("model_usage", {}).items():
             if model not in model_usage:
@@ -447,7 +497,6 @@ def aggregate_data(
             ) > longest_session.get("duration_ms", 0):
                 longest_session = ls
 
-    all_timestamps.sort(key=lambda x: x["ts"])
     total_tokens = sum(m.get("total", 0) for m in model_usage.values())
 
     for stats in per_source_stats.values():
@@ -457,21 +506,24 @@ def aggregate_data(
         stats["days"] = len(stats.pop("days_set"))
 
     date_range = None
-    if all_timestamps:
-        date_range = (all_timestamps[0]["ts"], all_timestamps[-1]["ts"])
+    if source_ranges:
+        date_range = (
+            min(start for start, _ in source_ranges),
+            max(end for _, end in source_ranges),
+        )
 
-    just_timestamps = [t["ts"] for t in all_timestamps]
-    streaks = calculate_streaks(just_timestamps)
+    streaks = calculate_streaks(list(day_events), now.date())
 
     return {
         "sources": source_names,
         "source_colors": source_colors,
         "per_source_stats": per_source_stats,
-        "tools": list(tools_seen),
+        "tools": tool_names,
         "tool_colors": tool_colors,
         "per_tool_stats": per_tool_stats,
         "date_range": date_range,
-        "all_timestamps": all_timestamps,
+        "day_events": day_events,
+        "tool_days": tool_days,
         "total_sessions": total_sessions,
         "total_messages": total_messages,
         "total_tokens": total_tokens,
@@ -482,40 +534,25 @@ def aggregate_data(
     }
 
 
-def calculate_streaks(timestamps: List[datetime]) -> Dict:
-    if not timestamps:
+def calculate_streaks(day_ordinals: Sequence[int], today: date) -> Dict:
+    if not day_ordinals:
         return {"current": 0, "longest": 0, "total_days": 0}
 
-    dates = sorted(set(ts.date() for ts in timestamps))
-
-    if not dates:
-        return {"current": 0, "longest": 0, "total_days": 0}
+    days = sorted(set(day_ordinals))
 
-    longest_streak = 1
-    current_streak = 1
+    # Indexes where the next active day isn't consecutive split the days into
+    # runs; the streaks are the run lengths
+    breaks = [i for i, (a, b) in enumerate(zip(days, days[1:]), 1) if b - a != 1]
+    bounds = [0] + breaks + [len(days)]
+    longest_streak = max(end - start for start, end in zip(bounds, bounds[1:]))
 
-    for i in range(1, len(dates)):
-        if (dates[i] - dates[i - 1]).days == 1:
-            current_streak += 1
-            longest_streak = max(longest_streak, current_streak)
-        else:
-            current_streak = 1
-
-    today = datetime.now().date()
-    if dates[-1] >= today - timedelta(days=1):
-        current_streak = 1
-        for i in range(len(dates) - 1, 0, -1):
-            if (dates[i] - dates[i - 1]).days == 1:
-                current_streak += 1
-            else:
-                break
-    else:
-        current_streak = 0
+    today_ordinal = today.toordinal()
+    current_streak = len(days) - bounds[-2] if days[-1] >= today_ordinal - 1 else 0
 
     return {
         "current": current_streak,
         "longest": longest_streak,
-        "total_days": len(dates),
+        "total_days": len(days),
     }
 
 
@@ -576,282 +613,8 @@ def format_model_name(model_name: str) -> str:
     return clean.title()[:20]
 
 
-def generate_html_report(data: Dict) -> str:
-    all_timestamps = data.get("all_timestamps", [])
-    sources = data.get("sources", ["local"])
-    source_colors = data.get("source_colors", {"local": MACHINE_COLORS[0]})
-    tools = data.get("tools", ["claude-code"])
-    tool_colors = data.get("tool_colors", {"claude-code": "#ff6b35"})
-    per_tool_stats = data.get("per_tool_stats", {})
-
-    first_date = None
-    if data.get("date_range"):
-        first_date = data["date_range"][0]
-
-    days_ago = 0
-    if first_date:
-        days_ago = (datetime.now() - first_date).days
-
-    active_dates = set()
-    date_activity = defaultdict(int)
-    date_sources = defaultdict(set)
-    date_tools = defaultdict(set)
-    for item in all_timestamps:
-        ts = item["ts"]
-        source = item["source"]
-        tool = item.get("tool", "claude-code")
-        d = ts.date()
-        active_dates.add(d)
-        date_activity[d] += 1
-        date_sources[d].add(source)
-        date_tools[d].add(tool)
-
-    max_activity = max(date_activity.values()) if date_activity else 1
-
-    # Calculate daily stats for "Today" view and last 7 days
-    today = datetime.now().date()
-    today_events = date_activity.get(today, 0)
-    today_tools = date_tools.get(today, set())
-    today_tools_count = len(today_tools)
-
-    total_events = sum(date_activity.values()) if date_activity else 1
-    tokens_per_event = data.get("total_tokens", 0) / total_events if total_events else 0
-
-    last_7_days = []
-    for i in range(6, -1, -1):
-        day = today - timedelta(days=i)
-        day_events = date_activity.get(day, 0)
-        day_tokens = int(day_events * tokens_per_event)
-        last_7_days.append(
-            {
-                "date": day,
-                "events": day_events,
-                "tokens": day_tokens,
-                "label": day.strftime("%a")[:2],
-            }
-        )
-
-    today_tokens = last_7_days[-1]["tokens"]
-    week_max_tokens = max(d["tokens"] for d in last_7_days) if last_7_days else 1
-    week_total_tokens = sum(d["tokens"] for d in last_7_days)
-
-    models = data.get("model_usage", {})
-    sorted_models = sorted(
-        models.items(), key=lambda x: x[1].get("total", 0), reverse=True
-    )
-
-    total_tokens = data.get("total_tokens", 0)
-    total_sessions = data.get("total_sessions", 0)
-    streaks = data.get("streaks", {})
-
-    weekly_tokens = defaultdict(int)
-    weekly_sources = defaultdict(set)
-    if all_timestamps:
-        year_start = datetime(datetime.now().year, 1, 1).date()
-        for item in all_timestamps:
-            ts = item["ts"]
-            source = item["source"]
-            week_num = (ts.date() - year_start).days // 7 + 1
-            if 1 <= week_num <= 52:
-                weekly_tokens[week_num] += 1
-                weekly_sources[week_num].add(source)
-
-    year = datetime.now().year
-
-    calendar_html = ""
-    months = [
-        "Jan",
-        "Feb",
-        "Mar",
-        "Apr",
-        "May",
-        "Jun",
-        "Jul",
-        "Aug",
-        "Sep",
-        "Oct",
-        "Nov",
-        "Dec",
-    ]
-
-    for month_idx, month_name in enumerate(months, 1):
-        month_start = datetime(year, month_idx, 1).date()
-        if month_idx == 12:
-            month_end = datetime(year + 1, 1, 1).date() - timedelta(days=1)
-        else:
-            month_end = datetime(year, month_idx + 1, 1).date() - timedelta(days=1)
-
-        days_html = ""
-        current = month_start
-        while current <= month_end:
-            activity = date_activity.get(current, 0)
-            day_tools = date_tools.get(current, set())
-
-            if activity == 0:
-                color = "var(--dot-inactive)"
-            elif len(day_tools) == 1:
-                tool = list(day_tools)[0]
-                color = tool_colors.get(tool, MACHINE_COLORS[0])
-            else:
-                color = (
-                    "linear-gradient(135deg, "
-                    + ", ".join(
-                        tool_colors.get(t, MACHINE_COLORS[0]) for t in sorted(day_tools)
-                    )
-                    + ")"
-                )
-
-            tools_str = ", ".join(sorted(day_tools)) if day_tools else "none"
-            days_html += f'<div class="dot" style="background: {color};" title="{current}: {activity} events ({tools_str})"></div>'
-            current += timedelta(days=1)
-
-        calendar_html += f"""
-        <div class="month">
-            <div class="month-label">{month_name}</div>
-            <div class="month-dots">{days_html}</div>
-        </div>
-        """
-
-    weeks_html = ""
-    max_weeks = 52
-    weekly_token_totals = defaultdict(int)
-    tokens_per_event = total_tokens / len(all_timestamps) if all_timestamps else 0
-    for week in range(1, max_weeks + 1):
-        weekly_token_totals[week] = int(weekly_tokens.get(week, 0) * tokens_per_event)
-
-    max_week_tokens = (
-        max(weekly_token_totals.values()) if any(weekly_token_totals.values()) else 1
-    )
-
-    for week in range(1, max_weeks + 1):
-        tokens = weekly_token_totals.get(week, 0)
-        opacity = 0.15 if tokens == 0 else 0.3 + (tokens / max_week_tokens) * 0.7
-        token_display = format_number(tokens) if tokens > 0 else ""
-        highlight = "highlight" if tokens > 0 else ""
-        weeks_html += f"""
-        <div class="week {highlight}" style="opacity: {opacity};">
-            <div class="week-label">Week {week}</div>
-            <div class="week-tokens">{token_display}</div>
-        </div>
-        """
-
-    models_html = ""
-    for idx, (model_name, usage) in enumerate(sorted_models[:5], 1):
-        display_name = format_model_name(model_name)
-        models_html += f'<div class="model-item"><span class="model-rank">{idx}</span> <span class="model-name">{display_name}</span></div>'
-
-    if not models_html:
-        models_html = '<div class="model-item"><span class="model-rank">-</span> <span class="model-name">No data</span></div>'
-
-    mini_calendar_html = ""
-    month_labels = ["J", "F", "M", "A", "M", "J", "J", "A", "S", "O", "N", "D"]
-
-    mini_calendar_html += '<div class="mini-month-labels">'
-    for label in month_labels:
-        mini_calendar_html += f'<div class="mini-month-label">{label}</div>'
-    mini_calendar_html += "</div>"
-
-    mini_calendar_html += '<div class="mini-calendar-grid">'
-    for month_idx in range(1, 13):
-        month_start = datetime(year, month_idx, 1).date()
-        if month_idx == 12:
-            month_end = datetime(year + 1, 1, 1).date() - timedelta(days=1)
-        else:
-            month_end = datetime(year, month_idx + 1, 1).date() - timedelta(days=1)
-
-        dots_html = ""
-        current = month_start
-        while current <= month_end:
-            activity = date_activity.get(current, 0)
-            day_tools_set = date_tools.get(current, set())
-
-            if activity == 0:
-                color = "var(--dot-inactive)"
-            elif len(day_tools_set) == 1:
-                tool = list(day_tools_set)[0]
-                color = tool_colors.get(tool, MACHINE_COLORS[0])
-            else:
-                color = tool_colors.get(sorted(day_tools_set)[0], MACHINE_COLORS[0])
-
-            dots_html += f'<div class="mini-dot" style="background: {color};"></div>'
-            current += timedelta(days=1)
-
-        mini_calendar_html += f'<div class="mini-month">{dots_html}</div>'
-    mini_calendar_html += "</div>"
-
-    tools_text = ", ".join(TOOL_CONFIG.get(t, {"name": t})["name"] for t in tools)
-
-    legend_html = ""
-    for tool in tools:
-        tool_cfg = TOOL_CONFIG.get(tool, {"name": tool, "color": "#888888"})
-        color = tool_colors.get(tool, tool_cfg["color"])
-        legend_html += f'<div class="legend-item"><div class="legend-dot" style="background: {color};"></div><span>{tool_cfg.get("name", tool)}</span></div>'
-
-    tool_cards_html = ""
-    for tool in tools:
-        tool_cfg = TOOL_CONFIG.get(
-            tool, {"name": tool, "color": "#888888", "icon": "?"}
-        )
-        stats = per_tool_stats.get(tool, {})
-        color = tool_colors.get(tool, tool_cfg["color"])
-        tool_cards_html += f"""
-        <div class="tool-card" style="border-left: 4px solid {color};">
-            <div class="tool-header">
-                <div class="tool-icon" style="background: {color};">{tool_cfg.get("icon", "?")}</div>
-                <div class="tool-name">{tool_cfg.get("name", tool)}</div>
-            </div>
-            <div class="tool-stats">
-                <div class="tool-stat"><span class="tool-stat-value">{format_number(stats.get("tokens", 0))}</span><span class="tool-stat-label">tokens</span></div>
-                <div class="tool-stat"><span class="tool-stat-value">{stats.get("days", 0)}</span><span class="tool-stat-label">days</span></div>
-                <div class="tool-stat"><span class="tool-stat-value">{stats.get("messages", 0)}</span><span class="tool-stat-label">messages</span></div>
-            </div>
-        </div>
-        """
-
-    sparkline_width = 400
-    sparkline_height = 100
-    sparkline_points = []
-    sparkline_coords = []
-    for i, day_data in enumerate(last_7_days):
-        x = (i / 6) * sparkline_width if len(last_7_days) > 1 else sparkline_width / 2
-        y = (
-            sparkline_height
-            - 20
-            - (day_data["tokens"] / week_max_tokens * (sparkline_height - 40))
-            if week_max_tokens > 0
-            else sparkline_height / 2
-        )
-        sparkline_points.append(f"{x:.1f},{y:.1f}")
-        sparkline_coords.append((x, y, day_data))
-
-    sparkline_path = " ".join(sparkline_points)
-    sparkline_labels = "".join(
-        f'<text x="{(i / 6) * sparkline_width}" y="{sparkline_height + 12}" fill="#888" font-size="10" text-anchor="middle">{d["label"]}</text>'
-        for i, d in enumerate(last_7_days)
-    )
-
-    sparkline_dots = ""
-    sparkline_values = ""
-    for x, y, day_data in sparkline_coords:
-        sparkline_dots += f'<circle cx="{x:.1f}" cy="{y:.1f}" r="4" fill="var(--accent)" stroke="var(--bg-dark)" stroke-width="2"/>'
-        value_y = y - 12 if y > 30 else y + 20
-        sparkline_values += f'<text x="{x:.1f}" y="{value_y:.1f}" fill="#fff" font-size="10" font-weight="500" text-anchor="middle">{format_number(day_data["tokens"])}</text>'
-
-    sparkline_svg = f'''<svg viewBox="0 0 {sparkline_width} {sparkline_height + 18}" class="week-sparkline">
-        <defs>
-            <linearGradient id="sparkGradient" x1="0%" y1="0%" x2="0%" y2="100%">
-                <stop offset="0%" style="stop-color:var(--accent);stop-opacity:0.3"/>
-                <stop offset="100%" style="stop-color:var(--accent);stop-opacity:0"/>
-            </linearGradient>
-        </defs>
-        <polygon points="0,{sparkline_height - 20} {sparkline_path} {sparkline_width},{sparkline_height - 20}" fill="url(#sparkGradient)"/>
-        <polyline points="{sparkline_path}" fill="none" stroke="var(--accent)" stroke-width="2.5" stroke-linecap="round" stroke-linejoin="round"/>
-        {sparkline_dots}
-        {sparkline_values}
-        {sparkline_labels}
-    </svg>'''
-
-    html = f"""<!DOCTYPE html>
+# Static page shell; the report fills it in with a single format_map call
+HTML_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -1568,18 +1331,18 @@ def generate_html_report(data: Dict) -> str:
         <section class="section today-section">
             <div class="today-header">
                 <h1 class="section-title">This Week</h1>
-                <span class="today-date">{today.strftime("%B %d, %Y")}</span>
+                <span class="today-date">{today_label}</span>
             </div>
-            <div class="today-meta">{today_events} events today across {today_tools_count} tool{"s" if today_tools_count != 1 else ""}</div>
+            <div class="today-meta">{today_events} events today across {today_tools_count} tool{today_tools_plural}</div>
             <div class="today-content">
                 <div class="today-hero">
-                    <div class="today-hero-value">{format_number(today_tokens)}</div>
+                    <div class="today-hero-value">{today_tokens_short}</div>
                     <div class="today-hero-label">Tokens Today</div>
                 </div>
                 <div class="today-chart">
                     <div class="today-chart-header">
                         <span class="today-chart-title">7 Day Trend</span>
-                        <span class="today-chart-total">{format_number(week_total_tokens)} this week</span>
+                        <span class="today-chart-total">{week_tokens_short} this week</span>
                     </div>
                     {sparkline_svg}
                 </div>
@@ -1601,18 +1364,18 @@ def generate_html_report(data: Dict) -> str:
                 </div>
                 <div class="stat">
                     <div class="stat-label">Total Days</div>
-                    <div class="stat-value">{streaks.get("total_days", 0)}</div>
+                    <div class="stat-value">{total_days}</div>
                 </div>
                 <div class="stat">
                     <div class="stat-label">Longest Streak</div>
-                    <div class="stat-value">{streaks.get("longest", 0)}d</div>
+                    <div class="stat-value">{longest_streak}d</div>
                 </div>
             </div>
         </section>
         
         <section class="section">
             <div class="year-header">
-                <h1 class="section-title">'{str(year)[2:]} Activity</h1>
+                <h1 class="section-title">'{year_short} Activity</h1>
             </div>
             <div class="calendar">
                 {calendar_html}
@@ -1626,20 +1389,20 @@ def generate_html_report(data: Dict) -> str:
                     <div class="card-left">
                         <div class="card-hero">
                             <div class="card-hero-label">Total Tokens</div>
-                            <div class="card-hero-value">{format_number(total_tokens)}</div>
+                            <div class="card-hero-value">{total_tokens_short}</div>
                         </div>
                         
                         <div class="card-stats">
                             <div class="card-stat">
-                                <div class="card-stat-value">{len(tools)}</div>
+                                <div class="card-stat-value">{tool_count}</div>
                                 <div class="card-stat-label">Tools</div>
                             </div>
                             <div class="card-stat">
-                                <div class="card-stat-value">{streaks.get("total_days", 0)}</div>
+                                <div class="card-stat-value">{total_days}</div>
                                 <div class="card-stat-label">Days</div>
                             </div>
                             <div class="card-stat">
-                                <div class="card-stat-value">{streaks.get("longest", 0)}d</div>
+                                <div class="card-stat-value">{longest_streak}d</div>
                                 <div class="card-stat-label">Streak</div>
                             </div>
                         </div>
@@ -1662,7 +1425,7 @@ def generate_html_report(data: Dict) -> str:
                     
                     <div class="card-right">
                         <div class="mini-calendar">
-                            <div class="mini-calendar-label">'{str(year)[2:]} Activity</div>
+                            <div class="mini-calendar-label">'{year_short} Activity</div>
                             {mini_calendar_html}
                         </div>
                     </div>
@@ -1684,7 +1447,7 @@ def generate_html_report(data: Dict) -> str:
             const button = document.querySelector('.share-button');
             
             // Open Twitter FIRST (direct user action - won't be blocked)
-            const twitterUrl = 'https://twitter.com/intent/tweet?text=My%20Claude%20Code%20Year%20in%20Review%3A%20{format_number(total_tokens)}%20tokens%20across%20{streaks.get("total_days", 0)}%20days!%20%F0%9F%9A%80%0A%0AGenerate%20yours%3A&url=https://github.com/CandooLabs/claude-year-stats';
+            const twitterUrl = 'https://twitter.com/intent/tweet?text=My%20Claude%20Code%20Year%20in%20Review%3A%20{total_tokens_short}%20tokens%20across%20{total_days}%20days!%20%F0%9F%9A%80%0A%0AGenerate%20yours%3A&url=https://github.com/CandooLabs/claude-year-stats';
             window.open(twitterUrl, '_blank');
             
             // Show loading state
@@ -1724,7 +1487,291 @@ def generate_html_report(data: Dict) -> str:
 </body>
 </html>"""
 
-    return html
+
+def generate_html_report(data: Dict, now: datetime) -> str:
+    sources = data.get("sources", ["local"])
+    source_colors = data.get("source_colors", {"local": MACHINE_COLORS[0]})
+    tools = data.get("tools", ["claude-code"])
+    tool_colors = data.get("tool_colors", {"claude-code": "#ff6b35"})
+    per_tool_stats = data.get("per_tool_stats", {})
+
+    first_date = None
+    if data.get("date_range"):
+        first_date = data["date_range"][0]
+
+    days_ago = 0
+    if first_date:
+        days_ago = (now - first_date).days
+
+    # The aggregator already counted events per day ordinal; only the tool
+    # sets need turning around to be looked up by day
+    activity_by_day = data.get("day_events", Counter())
+    tools_by_day = defaultdict(set)
+    for tool_name, days in data.get("tool_days", {}).items():
+        for day in days:
+            tools_by_day[day].add(tool_name)
+
+    max_activity = max(activity_by_day.values()) if activity_by_day else 1
+
+    # Calculate daily stats for "Today" view and last 7 days
+    today = now.date()
+    today_events = activity_by_day.get(today.toordinal(), 0)
+    today_tools = tools_by_day.get(today.toordinal(), set())
+    today_tools_count = len(today_tools)
+
+    total_events = sum(activity_by_day.values()) if activity_by_day else 1
+    tokens_per_event = data.get("total_tokens", 0) / total_events if total_events else 0
+
+    last_7_days = []
+    for i in range(6, -1, -1):
+        day = today - timedelta(days=i)
+        day_events = activity_by_day.get(day.toordinal(), 0)
+        day_tokens = int(day_events * tokens_per_event)
+        last_7_days.append(
+            {
+                "date": day,
+                "events": day_events,
+                "tokens": day_tokens,
+                "label": day.strftime("%a")[:2],
+            }
+        )
+
+    today_tokens = last_7_days[-1]["tokens"]
+    week_max_tokens = max(d["tokens"] for d in last_7_days) if last_7_days else 1
+    week_total_tokens = sum(d["tokens"] for d in last_7_days)
+
+    models = data.get("model_usage", {})
+    sorted_models = sorted(
+        models.items(), key=lambda x: x[1].get("total", 0), reverse=True
+    )
+
+    total_tokens = data.get("total_tokens", 0)
+    total_sessions = data.get("total_sessions", 0)
+    streaks = data.get("streaks", {})
+
+    year = now.year
+    year_start = date(year, 1, 1).toordinal()
+
+    # Both calendars walk every day of the year; index by day of year
+    # instead of probing the per-day dicts for each dot
+    no_tools = frozenset()
+    activity_by_doy = [activity_by_day.get(year_start + doy, 0) for doy in range(366)]
+    tools_by_doy = [tools_by_day.get(year_start + doy, no_tools) for doy in range(366)]
+
+    calendar_parts = []
+    months = [
+        "Jan",
+        "Feb",
+        "Mar",
+        "Apr",
+        "May",
+        "Jun",
+        "Jul",
+        "Aug",
+        "Sep",
+        "Oct",
+        "Nov",
+        "Dec",
+    ]
+
+    for month_idx, month_name in enumerate(months, 1):
+        month_start = datetime(year, month_idx, 1).date()
+        if month_idx == 12:
+            month_end = datetime(year + 1, 1, 1).date() - timedelta(days=1)
+        else:
+            month_end = datetime(year, month_idx + 1, 1).date() - timedelta(days=1)
+
+        day_parts = []
+        current = month_start
+        while current <= month_end:
+            doy = current.toordinal() - year_start
+            activity = activity_by_doy[doy]
+            day_tools = tools_by_doy[doy]
+
+            if activity == 0:
+                color = "var(--dot-inactive)"
+            elif len(day_tools) == 1:
+                tool = list(day_tools)[0]
+                color = tool_colors.get(tool, MACHINE_COLORS[0])
+            else:
+                color = (
+                    "linear-gradient(135deg, "
+                    + ", ".join(
+                        tool_colors.get(t, MACHINE_COLORS[0]) for t in sorted(day_tools)
+                    )
+                    + ")"
+                )
+
+            tools_str = ", ".join(sorted(day_tools)) if day_tools else "none"
+            day_parts.append(
+                f'<div class="dot" style="background: {color};" title="{current}: {activity} events ({tools_str})"></div>'
+            )
+            current += timedelta(days=1)
+
+        days_html = "".join(day_parts)
+        calendar_parts.append(f"""
+        <div class="month">
+            <div class="month-label">{month_name}</div>
+            <div class="month-dots">{days_html}</div>
+        </div>
+        """)
+    calendar_html = "".join(calendar_parts)
+
+    models_html = "".join(
+        f'<div class="model-item"><span class="model-rank">{idx}</span> <span class="model-name">{format_model_name(model_name)}</span></div>'
+        for idx, (model_name, usage) in enumerate(sorted_models[:5], 1)
+    )
+
+    if not models_html:
+        models_html = '<div class="model-item"><span class="model-rank">-</span> <span class="model-name">No data</span></div>'
+
+    month_labels = ["J", "F", "M", "A", "M", "J", "J", "A", "S", "O", "N", "D"]
+
+    mini_calendar_parts = ['<div class="mini-month-labels">']
+    for label in month_labels:
+        mini_calendar_parts.append(f'<div class="mini-month-label">{label}</div>')
+    mini_calendar_parts.append("</div>")
+
+    mini_calendar_parts.append('<div class="mini-calendar-grid">')
+    for month_idx in range(1, 13):
+        month_start = datetime(year, month_idx, 1).date()
+        if month_idx == 12:
+            month_end = datetime(year + 1, 1, 1).date() - timedelta(days=1)
+        else:
+            month_end = datetime(year, month_idx + 1, 1).date() - timedelta(days=1)
+
+        dot_parts = []
+        current = month_start
+        while current <= month_end:
+            doy = current.toordinal() - year_start
+            activity = activity_by_doy[doy]
+            day_tools_set = tools_by_doy[doy]
+
+            if activity == 0:
+                color = "var(--dot-inactive)"
+            elif len(day_tools_set) == 1:
+                tool = list(day_tools_set)[0]
+                color = tool_colors.get(tool, MACHINE_COLORS[0])
+            else:
+                color = tool_colors.get(sorted(day_tools_set)[0], MACHINE_COLORS[0])
+
+            dot_parts.append(
+                f'<div class="mini-dot" style="background: {color};"></div>'
+            )
+            current += timedelta(days=1)
+
+        dots_html = "".join(dot_parts)
+        mini_calendar_parts.append(f'<div class="mini-month">{dots_html}</div>')
+    mini_calendar_parts.append("</div>")
+    mini_calendar_html = "".join(mini_calendar_parts)
+
+    tools_text = ", ".join(TOOL_CONFIG.get(t, {"name": t})["name"] for t in tools)
+
+    legend_parts = []
+    for tool in tools:
+        tool_cfg = TOOL_CONFIG.get(tool, {"name": tool, "color": "#888888"})
+        color = tool_colors.get(tool, tool_cfg["color"])
+        legend_parts.append(
+            f'<div class="legend-item"><div class="legend-dot" style="background: {color};"></div><span>{tool_cfg.get("name", tool)}</span></div>'
+        )
+    legend_html = "".join(legend_parts)
+
+    tool_card_parts = []
+    for tool in tools:
+        tool_cfg = TOOL_CONFIG.get(
+            tool, {"name": tool, "color": "#888888", "icon": "?"}
+        )
+        stats = per_tool_stats.get(tool, {})
+        color = tool_colors.get(tool, tool_cfg["color"])
+        tool_card_parts.append(f"""
+        <div class="tool-card" style="border-left: 4px solid {color};">
+            <div class="tool-header">
+                <div class="tool-icon" style="background: {color};">{tool_cfg.get("icon", "?")}</div>
+                <div class="tool-name">{tool_cfg.get("name", tool)}</div>
+            </div>
+            <div class="tool-stats">
+                <div class="tool-stat"><span class="tool-stat-value">{format_number(stats.get("tokens", 0))}</span><span class="tool-stat-label">tokens</span></div>
+                <div class="tool-stat"><span class="tool-stat-value">{stats.get("days", 0)}</span><span class="tool-stat-label">days</span></div>
+                <div class="tool-stat"><span class="tool-stat-value">{stats.get("messages", 0)}</span><span class="tool-stat-label">messages</span></div>
+            </div>
+        </div>
+        """)
+    tool_cards_html = "".join(tool_card_parts)
+
+    sparkline_width = 400
+    sparkline_height = 100
+    sparkline_points = []
+    sparkline_coords = []
+    for i, day_data in enumerate(last_7_days):
+        x = (i / 6) * sparkline_width if len(last_7_days) > 1 else sparkline_width / 2
+        y = (
+            sparkline_height
+            - 20
+            - (day_data["tokens"] / week_max_tokens * (sparkline_height - 40))
+            if week_max_tokens > 0
+            else sparkline_height / 2
+        )
+        sparkline_points.append(f"{x:.1f},{y:.1f}")
+        sparkline_coords.append((x, y, day_data))
+
+    sparkline_path = " ".join(sparkline_points)
+    sparkline_labels = "".join(
+        f'<text x="{(i / 6) * sparkline_width}" y="{sparkline_height + 12}" fill="#888" font-size="10" text-anchor="middle">{d["label"]}</text>'
+        for i, d in enumerate(last_7_days)
+    )
+
+    sparkline_dot_parts = []
+    sparkline_value_parts = []
+    for x, y, day_data in sparkline_coords:
+        sparkline_dot_parts.append(
+            f'<circle cx="{x:.1f}" cy="{y:.1f}" r="4" fill="var(--accent)" stroke="var(--bg-dark)" stroke-width="2"/>'
+        )
+        value_y = y - 12 if y > 30 else y + 20
+        sparkline_value_parts.append(
+            f'<text x="{x:.1f}" y="{value_y:.1f}" fill="#fff" font-size="10" font-weight="500" text-anchor="middle">{format_number(day_data["tokens"])}</text>'
+        )
+    sparkline_dots = "".join(sparkline_dot_parts)
+    sparkline_values = "".join(sparkline_value_parts)
+
+    sparkline_svg = f'''<svg viewBox="0 0 {sparkline_width} {sparkline_height + 18}" class="week-sparkline">
+        <defs>
+            <linearGradient id="sparkGradient" x1="0%" y1="0%" x2="0%" y2="100%">
+                <stop offset="0%" style="stop-color:var(--accent);stop-opacity:0.3"/>
+                <stop offset="100%" style="stop-color:var(--accent);stop-opacity:0"/>
+            </linearGradient>
+        </defs>
+        <polygon points="0,{sparkline_height - 20} {sparkline_path} {sparkline_width},{sparkline_height - 20}" fill="url(#sparkGradient)"/>
+        <polyline points="{sparkline_path}" fill="none" stroke="var(--accent)" stroke-width="2.5" stroke-linecap="round" stroke-linejoin="round"/>
+        {sparkline_dots}
+        {sparkline_values}
+        {sparkline_labels}
+    </svg>'''
+
+    return HTML_TEMPLATE.format_map(
+        {
+            "year": year,
+            "year_short": str(year)[2:],
+            "days_ago": days_ago,
+            "total_days": streaks.get("total_days", 0),
+            "longest_streak": streaks.get("longest", 0),
+            "total_tokens": total_tokens,
+            "total_tokens_short": format_number(total_tokens),
+            "tool_count": len(tools),
+            "tools_text": tools_text,
+            "today_label": today.strftime("%B %d, %Y"),
+            "today_events": today_events,
+            "today_tools_count": today_tools_count,
+            "today_tools_plural": "s" if today_tools_count != 1 else "",
+            "today_tokens_short": format_number(today_tokens),
+            "week_tokens_short": format_number(week_total_tokens),
+            "sparkline_svg": sparkline_svg,
+            "tool_cards_html": tool_cards_html,
+            "calendar_html": calendar_html,
+            "mini_calendar_html": mini_calendar_html,
+            "legend_html": legend_html,
+            "models_html": models_html,
+        }
+    )
 
 
 def main():
@@ -1757,41 +1804,37 @@ def main():
         else:
             i += 1
 
+    # Read the clock once so every section agrees on "today" and the year,
+    # even if the run straddles midnight
+    now = datetime.now()
+
     print("\n" + "=" * 50)
     print("      AI Tools - Year in Review")
     print("=" * 50 + "\n")
 
     sources_data = []
+    jobs = []  # (tool name, data directory, source name)
     temp_dir = None
 
     try:
         if remotes:
+            import tempfile
+            from concurrent.futures import ThreadPoolExecutor
+
             temp_dir = Path(tempfile.mkdtemp(prefix="claude-review-"))
             print(f"Fetching data from {len(remotes)} remote(s)...")
 
-            for remote in remotes:
-                remote_tools = fetch_remote_data(remote, temp_dir)
+            # rsync runs in subprocesses, so threads are enough to overlap hosts
+            with ThreadPoolExecutor(max_workers=min(8, len(remotes))) as executor:
+                fetched_by_remote = list(
+                    executor.map(
+                        lambda remote: fetch_remote_data(remote, temp_dir), remotes
+                    )
+                )
+
+            for remote, remote_tools in zip(remotes, fetched_by_remote):
                 for tool_name, tool_path in remote_tools.items():
-                    if tool_name == "claude-code":
-                        data = analyze_claude_dir(tool_path, source_name=remote)
-                    elif tool_name == "continue":
-                        data = analyze_continue_dir(tool_path, source_name=remote)
-                    elif tool_name == "codex":
-                        from tool_parsers import analyze_codex_dir
-
-                        data = analyze_codex_dir(tool_path, source_name=remote)
-                    elif tool_name == "opencode":
-                        from tool_parsers import analyze_opencode_dir
-
-                        data = analyze_opencode_dir(tool_path, source_name=remote)
-                    else:
-                        continue
-                    if (
-                        data.get("timestamps")
-                        or data.get("total_sessions", 0) > 0
-                        or data.get("model_usage")
-                    ):
-                        sources_data.append(data)
+                    jobs.append((tool_name, tool_path, remote))
 
         for data_path_spec in data_paths:
             source_name = None
@@ -1813,13 +1856,7 @@ def main():
                         path.name if path.name != ".claude" else path.parent.name
                     )
                 print(f"  Including data from path: {path_str} (as {source_name})")
-                data = analyze_claude_dir(path, source_name=source_name)
-                if (
-                    data["timestamps"]
-                    or data["total_sessions"] > 0
-                    or data["model_usage"]
-                ):
-                    sources_data.append(data)
+                jobs.append(("claude-code", path, source_name))
             else:
                 print(f"  Warning: Path not found: {path_str}")
 
@@ -1829,26 +1866,17 @@ def main():
 
             for tool_name, tool_dir, source_name in tool_dirs:
                 print(f"  Found {tool_name} at {tool_dir}")
-                if tool_name == "claude-code":
-                    data = analyze_claude_dir(tool_dir, source_name=source_name)
-                elif tool_name == "continue":
-                    data = analyze_continue_dir(tool_dir, source_name=source_name)
-                elif tool_name == "codex":
-                    from tool_parsers import analyze_codex_dir
-
-                    data = analyze_codex_dir(tool_dir, source_name=source_name)
-                elif tool_name == "opencode":
-                    from tool_parsers import analyze_opencode_dir
-
-                    data = analyze_opencode_dir(tool_dir, source_name=source_name)
-                else:
-                    continue
-                if (
-                    data["timestamps"]
-                    or data["total_sessions"] > 0
-                    or data["model_usage"]
-                ):
-                    sources_data.append(data)
+                jobs.append((tool_name, tool_dir, source_name))
+
+        for job in jobs:
+            data = _analyze_source(job)
+            if data and (
+                data.get("timestamps")
+                or data.get("day_counts")
+                or data.get("total_sessions", 0) > 0
+                or data.get("model_usage")
+            ):
+                sources_data.append(data)
 
         if not sources_data:
             print("\nNo AI tool data found.")
@@ -1862,7 +1890,7 @@ def main():
         print(f"\nAggregating data from {len(sources_data)} source(s)...")
         if merge_sources:
             print(f"  Merging sources: {merge_sources}")
-        aggregated = aggregate_data(sources_data, merge_mapping=merge_sources)
+        aggregated = aggregate_data(sources_data, now, merge_mapping=merge_sources)
 
         if output_json:
 
@@ -1873,10 +1901,24 @@ def main():
                     return list(obj)
                 raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
 
-            json_data = {k: v for k, v in aggregated.items() if k != "all_timestamps"}
-            print(json.dumps(json_data, default=serialize, indent=2))
+            # The per-day tallies only feed the HTML report
+            event_columns = ("day_events", "tool_days")
+            json_data = {k: v for k, v in aggregated.items() if k not in event_columns}
+            if orjson is not None:
+                sys.stdout.flush()
+                sys.stdout.buffer.write(
+                    orjson.dumps(
+                        json_data,
+                        default=serialize,
+                        # Model keys can be None when a message has "model": null
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                    )
+                    + b"\n"
+                )
+            else:
+                print(json.dumps(json_data, default=serialize, indent=2))
         else:
-            html = generate_html_report(aggregated)
+            html = generate_html_report(aggregated, now)
             output_path = Path.home() / "ai-year-review.html"
             with open(output_path, "w") as f:
                 f.write(html)
@@ -1889,10 +1931,15 @@ def main():
             print(f"  Total tokens: {format_number(aggregated['total_tokens'])}")
             print(f"  Days active: {aggregated['streaks']['total_days']}")
             print("\nOpening in browser...")
+            import webbrowser
+
             webbrowser.open(f"file://{output_path}")
 
     finally:
+        shutdown_pool()
         if temp_dir and temp_dir.exists():
+            import shutil
+
             shutil.rmtree(temp_dir, ignore_errors=True)
 
 
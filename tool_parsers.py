@@ -1,28 +1,102 @@
 """Additional AI tool parsers for year review."""
 
 import json
-from datetime import datetime
+import os
+import re
+from collections import Counter, defaultdict
+from concurrent.futures import Executor
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
+try:
+    import orjson
 
-def parse_jsonl(filepath: Path) -> List[Dict]:
-    """Parse JSONL file into list of dicts."""
-    entries = []
-    if not filepath.exists():
-        return entries
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+
+# Files are read this much at a time, so most are a single read
+JSONL_CHUNK_SIZE = 64 << 20
+
+
+def _read_lines(filepath: Union[str, Path]) -> Iterator[bytes]:
+    """Yield the raw lines of a file; nothing if it can't be opened."""
     try:
-        with open(filepath, "r", encoding="utf-8", errors="ignore") as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    try:
-                        entries.append(json.loads(line))
-                    except json.JSONDecodeError:
-                        continue
-    except Exception:
-        pass
-    return entries
+        f = open(filepath, "rb")
+    except OSError:
+        return
+    with f:
+        pending = b""
+        while True:
+            chunk = f.read(JSONL_CHUNK_SIZE)
+            if not chunk:
+                break
+            # The piece after the last newline is carried into the next chunk
+            lines = (pending + chunk).split(b"\n")
+            pending = lines.pop()
+            yield from lines
+        if pending:
+            yield pending
+
+
+def _loads_line(line: bytes) -> Any:
+    """Decode one JSONL line, dropping invalid UTF-8 like a text-mode read."""
+    try:
+        return _loads(line)
+    except ValueError:
+        return _loads(line.decode("utf-8", "ignore"))
+
+
+def parse_jsonl(filepath: Union[str, Path]) -> Iterator[Dict]:
+    """Parse JSONL file, yielding one dict per line."""
+    # Both parsers accept surrounding whitespace; blank lines just fail to parse
+    for line in _read_lines(filepath):
+        try:
+            yield _loads_line(line)
+        except ValueError:
+            continue
+
+
+_TS_RE = re.compile(
+    r"^(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6}))?Z?$"
+)
+
+
+@lru_cache(maxsize=65536)
+def _parse_str_ts(ts: str) -> Optional[datetime]:
+    """Parse an ISO timestamp string; cached since logs repeat them heavily."""
+    # fromisoformat is C-implemented; before 3.11 it rejects some fractional
+    # second widths and "Z", which the regex below still covers
+    if len(ts) >= 19 and ts[10] == "T":
+        ts_iso = ts[:-1] + "+00:00" if ts.endswith("Z") else ts
+        try:
+            parsed = datetime.fromisoformat(ts_iso)
+        except ValueError:
+            pass
+        else:
+            # Offsets are normalised so every result is naive UTC, like "Z"
+            if parsed.tzinfo is not None:
+                parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+            return parsed
+    m = _TS_RE.match(ts)
+    if not m:
+        return None
+    year, month, day, hour, minute, second, frac = m.groups()
+    try:
+        return datetime(
+            int(year),
+            int(month),
+            int(day),
+            int(hour),
+            int(minute),
+            int(second),
+            int((frac or "0").ljust(6, "0")),
+        )
+    except ValueError:
+        return None
 
 
 def parse_timestamp(ts: Any) -> Optional[datetime]:
@@ -35,27 +109,180 @@ def parse_timestamp(ts: Any) -> Optional[datetime]:
                 return datetime.fromtimestamp(ts / 1000)
             return datetime.fromtimestamp(ts)
         if isinstance(ts, str):
-            for fmt in [
-                "%Y-%m-%dT%H:%M:%S.%fZ",
-                "%Y-%m-%dT%H:%M:%SZ",
-                "%Y-%m-%dT%H:%M:%S.%f",
-                "%Y-%m-%dT%H:%M:%S",
-            ]:
-                try:
-                    return datetime.strptime(ts, fmt)
-                except ValueError:
-                    continue
+            return _parse_str_ts(ts)
     except Exception:
         pass
     return None
 
 
+@lru_cache(maxsize=4096)
+def _day_start(day: str) -> Optional[datetime]:
+    """Midnight of a YYYY-MM-DD string; cached so a day is one shared object."""
+    try:
+        return datetime(int(day[:4]), int(day[5:7]), int(day[8:10]))
+    except ValueError:
+        return None
+
+
+def _fast_day(ts: Any) -> Optional[datetime]:
+    """Truncate a timestamp to its day, slicing ISO strings instead of parsing."""
+    if isinstance(ts, str) and len(ts) >= 10 and ts[4] == "-" and ts[7] == "-":
+        return _day_start(ts[:10])
+    parsed = parse_timestamp(ts)
+    if parsed:
+        return parsed.replace(hour=0, minute=0, second=0, microsecond=0)
+    return None
+
+
+def _iter_jsonl(root: Union[str, Path]) -> Iterator[str]:
+    """Yield paths of all *.jsonl files below root, without building Paths."""
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for e in it:
+                    if e.is_dir(follow_symlinks=False):
+                        stack.append(e.path)
+                    elif e.name.endswith(".jsonl"):
+                        yield e.path
+        except OSError:
+            continue
+
+
+# Below this many session files a process pool costs more to start than it saves
+PARALLEL_MIN_FILES = 4
+
+# One pool shared by every source, started on first parallel use so runs that
+# never reach PARALLEL_MIN_FILES don't import multiprocessing at all
+_pool: Optional[Executor] = None
+
+
+def map_session_files(
+    func: Callable[[str], Any], session_files: List[str]
+) -> List[Any]:
+    """Apply func to each session file, in a process pool when there are enough."""
+    global _pool
+    if len(session_files) < PARALLEL_MIN_FILES:
+        return list(map(func, session_files))
+    workers = os.cpu_count() or 1
+    if _pool is None:
+        from concurrent.futures import ProcessPoolExecutor
+
+        _pool = ProcessPoolExecutor(max_workers=workers)
+    chunksize = max(1, len(session_files) // (workers * 4))
+    return list(_pool.map(func, session_files, chunksize=chunksize))
+
+
+def shutdown_pool() -> None:
+    """Stop the shared session pool if one was started."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown()
+        _pool = None
+
+
+# Entry types that carry the session model or usage; the rest only count
+# towards activity timestamps
+_CODEX_TYPES = frozenset({"turn_context", "event_msg"})
+
+# Shared stand-in for missing sub-objects; never mutated
+_EMPTY = {}
+
+# Timestamp of a raw Codex line that starts with it, read without decoding
+_RAW_TS_RE = re.compile(rb'^\{"timestamp": ?"(\d{4}-\d{2}-\d{2}[^"]*)"')
+
+
+def _analyze_one_session(
+    session_file: str,
+) -> Tuple[
+    Dict[datetime, int], Optional[Tuple[datetime, datetime]], int, str, Optional[Dict]
+]:
+    """Scan one Codex session: (day counts, span, user messages, model, usage)."""
+    days = Counter()
+    first_ts = None
+    last_ts = None
+    messages = 0
+    last_usage = None
+    session_model = "unknown"
+
+    for line in _read_lines(session_file):
+        # Lines that can't be one of _CODEX_TYPES only contribute their
+        # timestamp. A line cut off mid-write doesn't end in "}", so it falls
+        # through to the decode below and is skipped like any undecodable line
+        if (
+            b'"turn_context"' not in line
+            and b'"event_msg"' not in line
+            and line.rstrip().endswith(b"}")
+        ):
+            m = _RAW_TS_RE.match(line)
+            if m:
+                raw_ts = m.group(1).decode()
+                ts = _day_start(raw_ts[:10])
+                if ts:
+                    days[ts] += 1
+                    if first_ts is None:
+                        first_ts = raw_ts
+                    last_ts = raw_ts
+                continue
+        # Only turn_context/event_msg lines (and odd ones) get here, so a typed
+        # decoder wouldn't pay for itself over plain dicts
+        try:
+            entry = _loads_line(line)
+        except ValueError:
+            continue
+
+        # Activity is only reported per day, so skip the full parse
+        raw_ts = entry.get("timestamp")
+        ts = _fast_day(raw_ts)
+        entry_type = entry.get("type", "")
+
+        if ts:
+            days[ts] += 1
+            if first_ts is None:
+                first_ts = raw_ts
+            last_ts = raw_ts
+
+        if entry_type not in _CODEX_TYPES:
+            continue
+        payload = entry.get("payload") or _EMPTY
+
+        # Get model from turn_context
+        if entry_type == "turn_context":
+            model = payload.get("model", session_model)
+            if model:
+                session_model = model
+
+        # Get usage from event_msg
+        elif entry_type == "event_msg":
+            msg_type = payload.get("type")
+            if msg_type == "user_message":
+                messages += 1
+            elif msg_type == "token_count":
+                info = payload.get("info") or _EMPTY
+                if info:
+                    last_usage = info.get("last_token_usage") or _EMPTY
+
+    # Days are enough for activity, but the date range needs real times;
+    # entries are appended in order, so only the ends are parsed in full
+    span = None
+    start = parse_timestamp(first_ts)
+    end = parse_timestamp(last_ts)
+    if start and end:
+        span = (start, end)
+
+    return days, span, messages, session_model, last_usage
+
+
 def analyze_codex_dir(codex_dir: Path, source_name: str = "local") -> Dict:
     """Analyze OpenAI Codex CLI usage data from sessions/*.jsonl."""
     result = {
         "source": source_name,
         "tool": "codex",
+        # Events are combined per day while scanning ({day ordinal: events}),
+        # so there are no per-event timestamps; date_range keeps real times
         "timestamps": [],
+        "day_counts": Counter(),
+        "date_range": None,
         "total_sessions": 0,
         "total_messages": 0,
         "model_usage": {},
@@ -67,61 +294,46 @@ def analyze_codex_dir(codex_dir: Path, source_name: str = "local") -> Dict:
     if not sessions_dir.exists():
         return result
 
-    session_files = list(sessions_dir.glob("**/*.jsonl"))
+    session_files = list(_iter_jsonl(sessions_dir))
     result["total_sessions"] = len(session_files)
 
-    for session_file in session_files:
-        last_usage = None
-        session_model = "unknown"
-
-        for entry in parse_jsonl(session_file):
-            ts = parse_timestamp(entry.get("timestamp"))
-            entry_type = entry.get("type", "")
+    sessions = map_session_files(_analyze_one_session, session_files)
 
-            if ts:
-                result["timestamps"].append(
-                    {"ts": ts, "source": source_name, "tool": "codex"}
+    model_usage = defaultdict(Counter)
+    day_counts = Counter()
+    for days, span, messages, session_model, last_usage in sessions:
+        day_counts.update(days)
+        if span:
+            date_range = result["date_range"]
+            if date_range is None:
+                result["date_range"] = span
+            else:
+                result["date_range"] = (
+                    min(date_range[0], span[0]),
+                    max(date_range[1], span[1]),
                 )
-
-            # Get model from turn_context
-            if entry_type == "turn_context":
-                payload = entry.get("payload", {})
-                model = payload.get("model", session_model)
-                if model:
-                    session_model = model
-
-            # Get usage from event_msg
-            if entry_type == "event_msg":
-                payload = entry.get("payload", {})
-                msg_type = payload.get("type")
-                if msg_type == "user_message":
-                    result["total_messages"] += 1
-                elif msg_type == "token_count":
-                    info = payload.get("info", {})
-                    if info:
-                        last_usage = info.get("last_token_usage", {})
+        result["total_messages"] += messages
 
         # Accumulate from last usage in session
         if last_usage and session_model:
-            if session_model not in result["model_usage"]:
-                result["model_usage"][session_model] = {
-                    "input": 0,
-                    "output": 0,
-                    "cache_read": 0,
+            inp = last_usage.get("input_tokens", 0)
+            out = last_usage.get("output_tokens", 0)
+            reasoning = last_usage.get("reasoning_output_tokens", 0)
+            model_usage[session_model].update(
+                {
+                    "input": inp,
+                    "output": out,
+                    "cache_read": last_usage.get("cached_input_tokens", 0),
+                    # Codex reports no cache writes; keeps the usual keys
                     "cache_creation": 0,
-                    "total": 0,
+                    "total": inp + out + reasoning,
                 }
+            )
 
-            inp = last_usage.get("input_" + "tokens", 0)
-            out = last_usage.get("output_" + "tokens", 0)
-            cached = last_usage.get("cached_input_" + "tokens", 0)
-            reasoning = last_usage.get("reasoning_output_" + "tokens", 0)
-
-            result["model_usage"][session_model]["input"] += inp
-            result["model_usage"][session_model]["output"] += out
-            result["model_usage"][session_model]["cache_read"] += cached
-            result["model_usage"][session_model]["total"] += inp + out + reasoning
-
+    result["day_counts"].update(
+        {day.toordinal(): events for day, events in day_counts.items()}
+    )
+    result["model_usage"] = {model: dict(usage) for model, usage in model_usage.items()}
     return result
 
 
@@ -141,18 +353,13 @@ def analyze_opencode_dir(opencode_dir: Path, source_name: str = "local") -> Dict
     log_dir = opencode_dir / "log"
     if log_dir.exists():
         for log_file in log_dir.glob("*.log"):
-            try:
-                name = log_file.stem
-                if "T" in name:
-                    date_part = name.split("T")[0]
-                    ts = parse_timestamp(date_part + "T00:00:00Z")
-                    if ts:
-                        result["timestamps"].append(
-                            {"ts": ts, "source": source_name, "tool": "opencode"}
-                        )
-                        result["total_sessions"] += 1
-            except Exception:
-                continue
+            # Logs are named YYYY-MM-DDTHHMMSS.log; only the day is used
+            name = log_file.name
+            if len(name) > 10 and name[4] == "-" and name[7] == "-" and name[10] == "T":
+                ts = _day_start(name[:10])
+                if ts:
+                    result["timestamps"].append(ts)
+                    result["total_sessions"] += 1
 
     storage_dir = opencode_dir / "storage" / "project"
     if storage_dir.exists():